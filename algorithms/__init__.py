@@ -4,4 +4,7 @@ from . import dijkstra
 from . import greedy
 from . import astar
 from . import rrt
-from . import prm
\ No newline at end of file
+from . import prm
+from . import cooperative
+from . import visibility
+from . import rrt_connect
\ No newline at end of file
@@ -0,0 +1,333 @@
+# algorithms/cooperative.py
+import heapq
+from array import array
+import core
+from core import grid, WALL, START, GOAL, PATH
+
+# Windowed Hierarchical Cooperative A* (WHCA*): every agent plans COOP_WINDOW
+# steps ahead in space-time against the reservations of the agents planned
+# before it, then all agents execute COOP_COMMIT steps and replan.
+COOP_WINDOW = 16
+COOP_COMMIT = 8
+COOP_MAX_STEPS = 2000
+COOP_STALL_WINDOWS = 2  # windows without progress before parked agents make way
+COOP_MAX_TABLES = 256   # goal distance tables kept at once (one int per cell each)
+
+
+def _free_mask():
+    """Flat bytearray of walkable cells (1 = free) plus the column count."""
+    rows, cols = len(grid), len(grid[0])
+    free = bytearray(rows * cols)
+    for r in range(rows):
+        row = grid[r]
+        base = r * cols
+        for c in range(cols):
+            if row[c] != WALL:
+                free[base + c] = 1
+    return free, cols
+
+
+def _moves(idx, free, cols):
+    out = []
+    c = idx % cols
+    if c > 0 and free[idx - 1]:
+        out.append(idx - 1)
+    if c < cols - 1 and free[idx + 1]:
+        out.append(idx + 1)
+    if idx >= cols and free[idx - cols]:
+        out.append(idx - cols)
+    if idx + cols < len(free) and free[idx + cols]:
+        out.append(idx + cols)
+    return out
+
+
+def _distance_table(goal, cell, free, cols, window, cache, stamp):
+    """Grid distance to `goal` (-1 = not explored or unreachable), exact for
+    every cell an agent at `cell` can reach within `window` steps.
+
+    The reverse BFS stops `window` levels past `cell`: the window search never
+    looks further, and a later query that needs more rebuilds the table deeper.
+    `cache` maps (map version, rows, cols, goal) -> (depth, table) and holds at
+    most COOP_MAX_TABLES tables; when it is full the shallowest one, the
+    cheapest to rebuild, is dropped.
+    """
+    n = len(free)
+    key = stamp + (goal,)
+    entry = cache.get(key)
+    if entry is not None:
+        depth, table = entry
+        d = table[cell]
+        if depth >= n or (d >= 0 and d + window <= depth):
+            return table
+    elif len(cache) >= COOP_MAX_TABLES:
+        del cache[min(cache, key=lambda k: cache[k][0])]
+
+    table = array("i", [-1]) * n
+    table[goal] = 0
+    frontier = [goal]
+    d = 0
+    limit = window if cell == goal else n
+    while frontier and d < limit:
+        d += 1
+        nxt = []
+        for idx in frontier:
+            c = idx % cols
+            for nb in (idx - 1 if c > 0 else -1,
+                       idx + 1 if c < cols - 1 else -1,
+                       idx - cols, idx + cols):
+                if 0 <= nb < n and free[nb] and table[nb] < 0:
+                    table[nb] = d
+                    nxt.append(nb)
+        if limit == n and table[cell] >= 0:
+            limit = d + window
+        frontier = nxt
+
+    # an exhausted BFS covers every reachable cell
+    cache[key] = (d if frontier else n, table)
+    return table
+
+
+def _plan_window(start, goal, dist, free, cols, window, vertex_res, edge_res):
+    """Space-time A* over `window` steps; returns one cell per timestep or None.
+
+    States are packed as t * cells + cell. Waiting costs 1 except on the goal,
+    so an agent that has arrived stays put unless it is pushed away.
+    """
+    n = len(free)
+    h = dist[start]
+    open_heap = [(h, h, start)]
+    came_from = {}
+    g_score = {start: 0}
+    closed_set = set()
+
+    while open_heap:
+        _, _, key = heapq.heappop(open_heap)
+        if key in closed_set:
+            continue
+        closed_set.add(key)
+
+        t, cell = divmod(key, n)
+        if t == window:
+            path = [cell]
+            while key in came_from:
+                key = came_from[key]
+                path.append(key % n)
+            path.reverse()
+            return path
+
+        g = g_score[key]
+        base = (t + 1) * n
+        for nb in _moves(cell, free, cols) + [cell]:
+            nkey = base + nb
+            if nkey in closed_set or nkey in vertex_res:
+                continue
+            # swapping places with another agent is an edge conflict
+            if nb != cell and (t * n + nb) * n + cell in edge_res:
+                continue
+            tentative = g + (0 if nb == cell == goal else 1)
+            if tentative < g_score.get(nkey, float("inf")):
+                came_from[nkey] = key
+                g_score[nkey] = tentative
+                h = dist[nb]
+                heapq.heappush(open_heap, (tentative + h, h, nkey))
+
+    return None
+
+
+def _route(cell, dist, free, cols):
+    """Cells of one shortest path from `cell` to the goal of `dist`."""
+    route = [cell]
+    while dist[cell] > 0:
+        cell = next(nb for nb in _moves(cell, free, cols) if dist[nb] == dist[cell] - 1)
+        route.append(cell)
+    return route
+
+
+def _side_cell(cell, avoid, free, cols):
+    """Nearest free cell to `cell` that is not in `avoid` (BFS), or None."""
+    seen = {cell}
+    frontier = [cell]
+    while frontier:
+        nxt = []
+        for idx in frontier:
+            if idx not in avoid:
+                return idx
+            for nb in _moves(idx, free, cols):
+                if nb not in seen:
+                    seen.add(nb)
+                    nxt.append(nb)
+        frontier = nxt
+    return None
+
+
+def _make_way(stalled, positions, goals, tables, free, cols):
+    """Planning goals for this window.
+
+    Agents whose goal lies on the route of a stalled agent (e.g. parked in the
+    mouth of a dead end it needs to enter) get a temporary goal beside that
+    route until the stalled agent has arrived.
+    """
+    targets = list(goals)
+    taken = set(goals) | set(positions)
+    for i in stalled:
+        dist = tables(i, goals[i], positions[i])
+        route = set(_route(positions[i], dist, free, cols))
+        for j, g in enumerate(goals):
+            if j != i and g in route and targets[j] == g:
+                spot = _side_cell(positions[j], route | taken, free, cols)
+                if spot is not None:
+                    targets[j] = spot
+                    taken.add(spot)
+    return targets
+
+
+def _reserve(path, n, vertex_res, edge_res):
+    for t, cell in enumerate(path):
+        vertex_res.add(t * n + cell)
+        if t and path[t - 1] != cell:
+            edge_res.add(((t - 1) * n + path[t - 1]) * n + cell)
+
+
+def _plan_all(order, positions, goals, targets, tables, free, cols, window, commit):
+    """Plan one window for every agent in priority order.
+
+    An agent that cannot find a window plan is promoted to highest priority and
+    the whole window is replanned; gives up after one restart per agent.
+    Also returns each agent's distance to its real goal after `commit` steps.
+    Tables are fetched per agent, so only the cache holds them between agents.
+    """
+    n = len(free)
+    order = list(order)
+    remaining = [0] * len(order)
+    for _ in range(len(order)):
+        vertex_res = set()
+        edge_res = set()
+        plans = [None] * len(order)
+        for i in order:
+            dist = tables(i, targets[i], positions[i])
+            plan = _plan_window(positions[i], targets[i], dist, free, cols,
+                                window, vertex_res, edge_res)
+            if plan is None:
+                break
+            _reserve(plan, n, vertex_res, edge_res)
+            plans[i] = plan
+            if targets[i] != goals[i]:
+                dist = tables(i, goals[i], positions[i])
+            remaining[i] = dist[plan[commit]]
+        else:
+            return plans, order, remaining
+        order.remove(i)
+        order.insert(0, i)
+    return None, order, remaining
+
+
+def _cooperative(agents, paths, window, commit, max_steps, cache):
+    free, cols = _free_mask()
+    starts = [r * cols + c for (r, c), _ in agents]
+    goals = [r * cols + c for _, (r, c) in agents]
+
+    if len(set(starts)) != len(starts) or len(set(goals)) != len(goals):
+        yield "fail"
+        return
+    for s, g in zip(starts, goals):
+        if not free[s] or not free[g]:
+            yield "fail"
+            return
+
+    # tables from before a wall edit (or for another grid size) are stale
+    stamp = (core.map_version, len(grid), cols)
+    for key in [k for k in cache if k[:3] != stamp]:
+        del cache[key]
+    # temporary goals from _make_way live here, only while they are in use
+    side_cache = {}
+
+    def tables(i, target, cell):
+        store = cache if target == goals[i] else side_cache
+        return _distance_table(target, cell, free, cols, window, store, stamp)
+
+    best = []
+    for i, s in enumerate(starts):
+        best.append(tables(i, goals[i], s)[s])
+        if best[i] < 0:
+            yield "fail"
+            return
+
+    del paths[:]
+    for (start, _) in agents:
+        paths.append([start])
+
+    positions = starts
+    order = list(range(len(agents)))
+    idle = [0] * len(agents)
+    steps = 0
+    commit = max(1, min(commit, window))
+
+    while positions != goals:
+        if steps >= max_steps:
+            yield "fail"
+            return
+
+        stalled = [i for i in order if idle[i] >= COOP_STALL_WINDOWS]
+        targets = _make_way(stalled, positions, goals, tables, free, cols) if stalled else goals
+        for key in [k for k in side_cache if k[3] not in targets]:
+            del side_cache[key]
+
+        plans, order, remaining = _plan_all(order, positions, goals, targets, tables,
+                                            free, cols, window, commit)
+        if plans is None:
+            yield "fail"
+            return
+
+        for t in range(1, commit + 1):
+            for path, plan in zip(paths, plans):
+                path.append(divmod(plan[t], cols))
+            positions = [plan[t] for plan in plans]
+            steps += 1
+            if positions == goals:
+                break
+            yield "step"
+
+        for i, d in enumerate(remaining):
+            if d < best[i] or d == 0:
+                best[i] = d
+                idle[i] = 0
+            else:
+                idle[i] += 1
+
+        # rotate priorities so no agent is always the one stepping aside
+        order = order[1:] + order[:1]
+
+    yield "done"
+
+
+def plan(agents, window=COOP_WINDOW, commit=COOP_COMMIT,
+         max_steps=COOP_MAX_STEPS, cache=None):
+    """Collision-free paths for a batch of (start, goal) agents on core.grid.
+
+    Returns one list of cells per agent, indexed by timestep, or None when the
+    batch cannot be solved. `cache` holds goal distance tables and may be
+    reused across calls; entries are keyed on core.map_version, so tables from
+    before core.walls_changed() are dropped rather than reused.
+    """
+    if cache is None:
+        cache = {}
+    paths = []
+    for state in _cooperative(agents, paths, window, commit, max_steps, cache):
+        if state == "done":
+            return paths
+        if state == "fail":
+            return None
+    return None
+
+
+def run(agents, paths):
+    """Step-by-step version of plan(); `paths` is filled as steps are committed."""
+    endpoints = {cell for pair in agents for cell in pair}
+    for state in _cooperative(agents, paths, COOP_WINDOW, COOP_COMMIT,
+                              COOP_MAX_STEPS, {}):
+        for path in paths:
+            (r, c) = path[-1]
+            if (r, c) not in endpoints:
+                if grid[r][c] not in (START, GOAL, WALL):
+                    grid[r][c] = PATH
+        yield state
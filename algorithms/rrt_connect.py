@@ -0,0 +1,133 @@
+# algorithms/rrt_connect.py
+import random
+import time
+from core import (
+    grid, euclidean, line_of_sight, draw_segment_path,
+    START, GOAL, OPEN, WALL
+)
+
+RRT_CONNECT_MAX_ITERS = 4000
+RRT_CONNECT_STEP = 4         # max cells covered by one extension
+RRT_CONNECT_GOAL_BIAS = 0.1  # chance of sampling the other tree's root
+
+NEIGHBORS_8 = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+def _sample(rng):
+    rows, cols = len(grid), len(grid[0])
+    while True:
+        r = rng.randrange(rows)
+        c = rng.randrange(cols)
+        if grid[r][c] != WALL:
+            return (r, c)
+
+
+def _extend(parent, nodes, target, step):
+    """Grow the tree up to `step` cells towards target; returns the new node or None.
+
+    A blocked step is shortened until the segment is free. If even a single
+    cell is blocked, the tree slides to the free neighbour that gets closest to
+    target, so it keeps growing along walls instead of stalling against them.
+    Either way the new node is strictly closer to target than the tree was.
+    """
+    q_near = min(nodes, key=lambda n: euclidean(n, target))
+    d = euclidean(q_near, target)
+    if d == 0:
+        return None
+
+    q_new = None
+    for k in range(step, 0, -1):
+        if d <= k:
+            cand = target
+        else:
+            cand = (round(q_near[0] + (target[0] - q_near[0]) * k / d),
+                    round(q_near[1] + (target[1] - q_near[1]) * k / d))
+        if cand != q_near and cand not in parent and line_of_sight(q_near, cand):
+            q_new = cand
+            break
+
+    if q_new is None:
+        rows, cols = len(grid), len(grid[0])
+        best = d
+        for dr, dc in NEIGHBORS_8:
+            cand = (q_near[0] + dr, q_near[1] + dc)
+            if 0 <= cand[0] < rows and 0 <= cand[1] < cols and cand not in parent:
+                dist = euclidean(cand, target)
+                if dist < best and line_of_sight(q_near, cand):
+                    q_new, best = cand, dist
+        if q_new is None:
+            return None
+
+    parent[q_new] = q_near
+    nodes.append(q_new)
+    return q_new
+
+
+def _branch(parent, node):
+    """Node back to the root of its tree."""
+    out = []
+    while node is not None:
+        out.append(node)
+        node = parent[node]
+    return out
+
+
+def run(start, goal, seed=None, stats=None):
+    """Bidirectional RRT (RRT-Connect) with goal biasing.
+
+    `seed` gives a private RNG (the global `random` state is used otherwise).
+    If a `stats` dict is passed it receives the iteration count and the time
+    spent planning, excluding time suspended between steps.
+    """
+    rng = random if seed is None else random.Random(seed)
+    tree_a, nodes_a, root_b = {start: None}, [start], goal
+    tree_b, nodes_b, root_a = {goal: None}, [goal], start
+    elapsed = 0.0
+    t0 = time.perf_counter()
+
+    for it in range(1, RRT_CONNECT_MAX_ITERS + 1):
+        if rng.random() < RRT_CONNECT_GOAL_BIAS:
+            q_rand = root_b
+        else:
+            q_rand = _sample(rng)
+
+        q_new = _extend(tree_a, nodes_a, q_rand, RRT_CONNECT_STEP)
+        if q_new is not None:
+            # CONNECT: pull the other tree towards q_new until it gets there or is blocked
+            q_reached = q_new
+            while True:
+                q_b = _extend(tree_b, nodes_b, q_new, RRT_CONNECT_STEP)
+                if q_b is None:
+                    q_reached = None if q_new not in tree_b else q_new
+                    break
+                if grid[q_b[0]][q_b[1]] not in (START, GOAL):
+                    grid[q_b[0]][q_b[1]] = OPEN
+                if q_b == q_new:
+                    break
+
+            if grid[q_new[0]][q_new[1]] not in (START, GOAL):
+                grid[q_new[0]][q_new[1]] = OPEN
+
+            if q_reached is not None:
+                path_points = _branch(tree_a, q_new)[::-1] + _branch(tree_b, q_new)[1:]
+                if path_points[0] != start:
+                    path_points.reverse()
+                draw_segment_path(path_points, start, goal)
+                if stats is not None:
+                    stats["iterations"] = it
+                    stats["time"] = elapsed + time.perf_counter() - t0
+                yield "done"
+                return
+
+        tree_a, nodes_a, root_b, tree_b, nodes_b, root_a = (
+            tree_b, nodes_b, root_a, tree_a, nodes_a, root_b
+        )
+
+        elapsed += time.perf_counter() - t0
+        yield "step"
+        t0 = time.perf_counter()
+
+    if stats is not None:
+        stats["iterations"] = RRT_CONNECT_MAX_ITERS
+        stats["time"] = elapsed + time.perf_counter() - t0
+    yield "fail"
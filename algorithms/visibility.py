@@ -0,0 +1,179 @@
+# algorithms/visibility.py
+import heapq
+import core
+from core import (
+    grid, euclidean, line_of_sight, reconstruct_path, draw_segment_path,
+    START, GOAL, OPEN, CLOSED, WALL
+)
+
+DIAGONALS = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+# (map_version, rows, cols) -> (corners, adjacency); holds the current map only
+_cache = {}
+
+
+def _corners():
+    """Free cells next to a convex wall corner: a diagonal neighbour is a wall
+    while both orthogonal cells next to it are free."""
+    rows, cols = len(grid), len(grid[0])
+    corners = []
+    for r in range(rows):
+        for c in range(cols):
+            if grid[r][c] == WALL:
+                continue
+            for dr, dc in DIAGONALS:
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] == WALL:
+                    if grid[nr][c] != WALL and grid[r][nc] != WALL:
+                        corners.append((r, c))
+                        break
+    return corners
+
+
+def _visible(p, targets, blocked, cols):
+    """Targets with line of sight from p.
+
+    Same cells and answer as core.line_of_sight, but the minor axis is stepped
+    with integer remainders (ties round half to even, like round()) instead of
+    a float round() per cell; linking every corner pair is dominated by this.
+    """
+    r1, c1 = p
+    out = []
+    for q in targets:
+        dr, dc = q[0] - r1, q[1] - c1
+        sr, ar = (-1, -dr) if dr < 0 else (1, dr)
+        sc, ac = (-1, -dc) if dc < 0 else (1, dc)
+        if ar >= ac:
+            # one row per step; column is c1 + dc * i / ar rounded
+            steps, minor, rem, idx = ar, c1, 0, r1 * cols
+            for _ in range(steps - 1):
+                idx += sr * cols
+                rem += ac
+                if rem >= steps:
+                    rem -= steps
+                    minor += sc
+                if 2 * rem > steps:
+                    cc = minor + sc
+                elif 2 * rem < steps:
+                    cc = minor
+                else:
+                    cc = minor if sc > 0 else minor - 1
+                    cc += cc % 2
+                if blocked[idx + cc]:
+                    break
+            else:
+                out.append(q)
+        else:
+            # one column per step; row is r1 + dr * i / ac rounded
+            steps, minor, rem = ac, r1, 0
+            for i in range(1, steps):
+                rem += ar
+                if rem >= steps:
+                    rem -= steps
+                    minor += sr
+                if 2 * rem > steps:
+                    rr = minor + sr
+                elif 2 * rem < steps:
+                    rr = minor
+                else:
+                    rr = minor if sr > 0 else minor - 1
+                    rr += rr % 2
+                if blocked[rr * cols + c1 + sc * i]:
+                    break
+            else:
+                out.append(q)
+    return out
+
+
+def _blocked():
+    return [v == WALL for row in grid for v in row]
+
+
+def corner_graph():
+    """Visibility graph between wall corners for the current map.
+
+    Built once per core.map_version. Every visible pair is linked: vertices
+    are cell centres and line_of_sight is a rasterised test, so no geometric
+    tautness rule is safe to prune with. That makes the build O(corners^2):
+    the ~5000 corners of a 25 % random 100x160 map take around ten seconds,
+    so much larger maps should use a grid planner instead.
+    """
+    key = (core.map_version, len(grid), len(grid[0]))
+    graph = _cache.get(key)
+    if graph is not None:
+        return graph
+
+    corners = _corners()
+    blocked, cols = _blocked(), len(grid[0])
+    adjacency = {p: [] for p in corners}
+    for i, p in enumerate(corners):
+        for q in _visible(p, corners[i + 1:], blocked, cols):
+            d = euclidean(p, q)
+            adjacency[p].append((q, d))
+            adjacency[q].append((p, d))
+
+    _cache.clear()
+    _cache[key] = (corners, adjacency)
+    return _cache[key]
+
+
+def _links(p, corners, blocked):
+    """Corners visible from a query point (start or goal)."""
+    others = [q for q in corners if q != p]
+    return [(q, euclidean(p, q)) for q in _visible(p, others, blocked, len(grid[0]))]
+
+
+def run(start, goal):
+    corners, adjacency = corner_graph()
+
+    # start/goal edges live only for this query; the cached graph is untouched
+    blocked = _blocked()
+    start_links = _links(start, corners, blocked)
+    if line_of_sight(start, goal):
+        start_links.append((goal, euclidean(start, goal)))
+    goal_links = dict(_links(goal, corners, blocked))
+
+    open_heap = []
+    heapq.heappush(open_heap, (euclidean(start, goal), start))
+    came_from = {}
+    g_score = {start: 0}
+    closed_set = set()
+
+    while open_heap:
+        _, current = heapq.heappop(open_heap)
+        if current in closed_set:
+            continue
+        closed_set.add(current)
+
+        (r, c) = current
+        if current not in (start, goal):
+            if grid[r][c] not in (START, GOAL, WALL):
+                grid[r][c] = CLOSED
+
+        if current == goal:
+            path_points = [start] + reconstruct_path(came_from, goal)
+            draw_segment_path(path_points, start, goal)
+            yield "done"
+            return
+
+        if current == start:
+            edges = start_links
+        else:
+            edges = adjacency.get(current, [])
+            if current in goal_links:
+                edges = edges + [(goal, goal_links[current])]
+
+        for nb, cost in edges:
+            tentative = g_score[current] + cost
+            if tentative < g_score.get(nb, float("inf")):
+                came_from[nb] = current
+                g_score[nb] = tentative
+                heapq.heappush(open_heap, (tentative + euclidean(nb, goal), nb))
+                nr, nc = nb
+                if nb not in (start, goal):
+                    if grid[nr][nc] not in (START, GOAL, WALL):
+                        grid[nr][nc] = OPEN
+
+        yield "step"
+
+    yield "fail"
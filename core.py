@@ -10,6 +10,9 @@ EMPTY, WALL, START, GOAL, OPEN, CLOSED, PATH = range(7)
 # Global grid shared by main + algorithms
 grid = [[EMPTY for _ in range(COLS)] for _ in range(ROWS)]
 
+# Bumped whenever walls change so planners can cache per-map data
+map_version = 0
+
 
 # ---------- BASIC HELPERS ----------
 def neighbors(rc):
@@ -67,6 +70,12 @@ def line_of_sight(a, b):
     return True
 
 
+def walls_changed():
+    """Call after adding/removing walls; invalidates cached map data."""
+    global map_version
+    map_version += 1
+
+
 def reset_search_states():
     """Clear OPEN/CLOSED/PATH back to EMPTY but keep walls."""
     for r in range(ROWS):
@@ -77,8 +86,6 @@ def reset_search_states():
 
 def draw_segment_path(path_points, start, goal):
     """Paint continuous path between roadmap vertices (for PRM)."""
-    from .core import grid as g  # optional if you save this in a package, otherwise remove this line
-
     for i in range(len(path_points) - 1):
         a = path_points[i]
         b = path_points[i + 1]
@@ -5,10 +5,10 @@ from collections import deque
 from core import (
     ROWS, COLS, grid,
     EMPTY, WALL, START, GOAL, OPEN, CLOSED, PATH,
-    reset_search_states,
+    reset_search_states, random_free_cell, walls_changed,
 )
 
-from algorithms import bfs, dfs, dijkstra, greedy, astar, rrt, prm
+from algorithms import bfs, dfs, dijkstra, greedy, astar, rrt, prm, cooperative, visibility, rrt_connect
 
 # ---------- CONFIG ----------
 CELL_SIZE = 24
@@ -16,6 +16,7 @@ TOP_UI_HEIGHT = 80
 FPS = 60
 
 WALL_PROB = 0.32
+MULTI_AGENT_COUNT = 12
 
 # F1 color theme (RGB)
 COLORS = {
@@ -33,7 +34,7 @@ UI_BG = BG_COLOR
 UI_TEXT = (0, 0, 0)
 GRID_LINE = (239, 11, 11)
 
-ALGO_NAMES = ["BFS", "DFS", "Dijkstra", "Greedy", "A*", "RRT", "PRM"]
+ALGO_NAMES = ["BFS", "DFS", "Dijkstra", "Greedy", "A*", "RRT", "PRM", "Multi-Agent", "Any-Angle", "RRT-Connect"]
 ALGO_FUNCS = [
     bfs.run,
     dfs.run,
@@ -42,6 +43,9 @@ ALGO_FUNCS = [
     astar.run,
     rrt.run,
     prm.run,
+    cooperative.run,
+    visibility.run,
+    rrt_connect.run,
 ]
 
 # ---------- GLOBAL STATE ----------
@@ -50,6 +54,9 @@ goal_pos = None
 running_algo = False
 algo_gen = None
 selected_algo_index = 4  # default A*
+agents = []          # (start, goal) pairs for the multi-agent planner
+agent_paths = []     # one list of cells per agent, grows as steps are planned
+run_stats = {}       # iterations / time reported by planners that support it
 status_message = "Left-click: set START, then GOAL, then walls. SPACE to run."
 
 # ---------- PYGAME INIT ----------
@@ -96,6 +103,8 @@ def generate_connected_random_map():
     algo_gen = None
     start_pos = None
     goal_pos = None
+    del agents[:]
+    del agent_paths[:]
 
     # clear grid to EMPTY (do NOT reassign grid, it's in core)
     for r in range(ROWS):
@@ -112,6 +121,7 @@ def generate_connected_random_map():
             grid[r][c] = WALL
             if not is_grid_connected():
                 grid[r][c] = EMPTY
+    walls_changed()
 
     status_message = "New map. Left-click: START, then GOAL, then walls. SPACE to run."
 
@@ -120,6 +130,8 @@ def clear_path_only():
     global algo_gen, running_algo, status_message
     running_algo = False
     algo_gen = None
+    del agents[:]
+    del agent_paths[:]
     reset_search_states()
     if start_pos:
         grid[start_pos[0]][start_pos[1]] = START
@@ -129,6 +141,22 @@ def clear_path_only():
 
 
 # ---------- RUN / CONTROL ----------
+def pick_agents():
+    """START/GOAL pair plus random extra agents with distinct endpoints."""
+    del agents[:]
+    agents.append((start_pos, goal_pos))
+    used_starts = {start_pos}
+    used_goals = {goal_pos}
+    while len(agents) < MULTI_AGENT_COUNT:
+        s = random_free_cell()
+        g = random_free_cell()
+        if s == g or s in used_starts or g in used_goals:
+            continue
+        used_starts.add(s)
+        used_goals.add(g)
+        agents.append((s, g))
+
+
 def run_algorithm():
     global algo_gen, running_algo, status_message
 
@@ -142,7 +170,18 @@ def run_algorithm():
 
     algo_func = ALGO_FUNCS[selected_algo_index]
     name = ALGO_NAMES[selected_algo_index]
-    algo_gen = algo_func(start_pos, goal_pos)
+    run_stats.clear()
+    if algo_func is cooperative.run:
+        pick_agents()
+        algo_gen = algo_func(agents, agent_paths)
+    elif algo_func is rrt_connect.run:
+        del agents[:]
+        del agent_paths[:]
+        algo_gen = algo_func(start_pos, goal_pos, stats=run_stats)
+    else:
+        del agents[:]
+        del agent_paths[:]
+        algo_gen = algo_func(start_pos, goal_pos)
 
     running_algo = True
     status_message = f"Running {name} ..."
@@ -193,6 +232,9 @@ def handle_left_click(pos):
         elif cell in (EMPTY, OPEN, CLOSED, PATH):
             grid[r][c] = WALL
 
+    if (cell == WALL) != (grid[r][c] == WALL):
+        walls_changed()
+
 
 # ---------- DRAWING ----------
 def draw():
@@ -205,7 +247,7 @@ def draw():
     screen.blit(title_surf, (16, 10))
 
     algo_name = ALGO_NAMES[selected_algo_index]
-    algo_text = f"Algorithm: {algo_name}  [1:BFS 2:DFS 3:Dij 4:Greedy 5:A* 6:RRT 7:PRM]"
+    algo_text = f"Algorithm: {algo_name}  [1:BFS 2:DFS 3:Dij 4:Greedy 5:A* 6:RRT 7:PRM 8:Multi 9:Any 0:RRT-C]"
     algo_surf = font_small.render(algo_text, True, UI_TEXT)
     screen.blit(algo_surf, (16, 40))
 
@@ -231,6 +273,18 @@ def draw():
         gy = TOP_UI_HEIGHT + goal_pos[0] * CELL_SIZE + CELL_SIZE // 2
         pygame.draw.circle(screen, (249, 250, 251), (gx, gy), CELL_SIZE // 4, 2)
 
+    # multi-agent: goal outline + current position, one hue per agent
+    for i, path in enumerate(agent_paths):
+        color = pygame.Color(0)
+        color.hsva = (i * 360 / max(1, len(agent_paths)), 90, 90, 100)
+        (gr, gc) = agents[i][1]
+        pygame.draw.rect(screen, color, (gc * CELL_SIZE + 3, TOP_UI_HEIGHT + gr * CELL_SIZE + 3,
+                                         CELL_SIZE - 6, CELL_SIZE - 6), 2)
+        (ar, ac) = path[-1]
+        ax = ac * CELL_SIZE + CELL_SIZE // 2
+        ay = TOP_UI_HEIGHT + ar * CELL_SIZE + CELL_SIZE // 2
+        pygame.draw.circle(screen, color, (ax, ay), CELL_SIZE // 3)
+
 
 # ---------- MAIN LOOP ----------
 def main():
@@ -261,8 +315,10 @@ def main():
                     clear_path_only()
 
                 elif event.key in (pygame.K_1, pygame.K_2, pygame.K_3,
-                                   pygame.K_4, pygame.K_5, pygame.K_6, pygame.K_7):
-                    selected_algo_index = event.key - pygame.K_1
+                                   pygame.K_4, pygame.K_5, pygame.K_6, pygame.K_7,
+                                   pygame.K_8, pygame.K_9, pygame.K_0):
+                    # keys 1-9 pick the first nine algorithms, 0 the tenth
+                    selected_algo_index = 9 if event.key == pygame.K_0 else event.key - pygame.K_1
                     algo_name = ALGO_NAMES[selected_algo_index]
                     status_message = f"Selected {algo_name}. SPACE to run."
 
@@ -272,7 +328,9 @@ def main():
         # --- update algorithm ---
         if running_algo and algo_gen is not None:
             try:
-                for _ in range(5):  # multiple steps per frame
+                # multi-agent: one timestep per frame so the moves stay visible
+                steps_per_frame = 1 if agents else 5
+                for _ in range(steps_per_frame):  # multiple steps per frame
                     state = next(algo_gen)
                     if state in ("done", "fail"):
                         running_algo = False
@@ -280,6 +338,9 @@ def main():
                             status_message = f"Path found with {ALGO_NAMES[selected_algo_index]}."
                         else:
                             status_message = "No path found."
+                        if run_stats:
+                            status_message += (f" {run_stats['iterations']} iterations,"
+                                               f" {run_stats['time'] * 1000:.1f} ms.")
                         break
             except StopIteration:
                 running_algo = False
@@ -0,0 +1,103 @@
+# tests/conftest.py
+import os
+import random
+import sys
+from collections import deque
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core
+from algorithms import prm, rrt
+
+MAP_SIZES = [(25, 40), (50, 80), (100, 160)]
+MAP_SEED = 1234
+WALL_PROB = 0.25
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "perf: throughput and memory budget checks")
+
+
+def _component(seed_cell):
+    rows, cols = len(core.grid), len(core.grid[0])
+    dist = {seed_cell: 0}
+    q = deque([seed_cell])
+    while q:
+        r, c = q.popleft()
+        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols:
+                if core.grid[nr][nc] != core.WALL and (nr, nc) not in dist:
+                    dist[(nr, nc)] = dist[(r, c)] + 1
+                    q.append((nr, nc))
+    return dist
+
+
+def bfs_distance(start, goal):
+    return _component(start).get(goal)
+
+
+@pytest.fixture
+def make_map(monkeypatch):
+    """Build a seeded random map of any size in core.grid.
+
+    Returns (start, goal): the top-left-most cell of the largest component and
+    the cell furthest from it. The original grid and dimensions are restored.
+    """
+    saved = [row[:] for row in core.grid]
+
+    def _make(rows, cols, seed=MAP_SEED):
+        for mod in (core, prm, rrt):
+            monkeypatch.setattr(mod, "ROWS", rows)
+            monkeypatch.setattr(mod, "COLS", cols)
+
+        rng = random.Random(seed)
+        core.grid[:] = [
+            [core.WALL if rng.random() < WALL_PROB else core.EMPTY for _ in range(cols)]
+            for _ in range(rows)
+        ]
+        free = [(r, c) for r in range(rows) for c in range(cols) if core.grid[r][c] != core.WALL]
+        for cell in free:
+            dist = _component(cell)
+            if len(dist) * 2 >= len(free):
+                break
+        start = min(dist, key=lambda rc: (rc[0] + rc[1], rc))
+        dist = _component(start)
+        goal = max(dist, key=lambda rc: (dist[rc], rc))
+        core.grid[start[0]][start[1]] = core.START
+        core.grid[goal[0]][goal[1]] = core.GOAL
+        core.walls_changed()
+        return start, goal
+
+    yield _make
+    core.grid[:] = saved
+
+
+def random_agents(start, count, seed=MAP_SEED):
+    """`count` (start, goal) pairs with distinct starts and distinct goals, all
+    in the component of `start`."""
+    cells = sorted(_component(start))
+    rng = random.Random(seed)
+    return list(zip(rng.sample(cells, count), rng.sample(cells, count)))
+
+
+def drain(gen):
+    """Run a planner generator to completion; returns (final state, steps)."""
+    steps = 0
+    state = None
+    for state in gen:
+        if state in ("done", "fail"):
+            break
+        steps += 1
+    return state, steps
+
+
+def path_cells():
+    return {
+        (r, c)
+        for r, row in enumerate(core.grid)
+        for c, v in enumerate(row)
+        if v == core.PATH
+    }
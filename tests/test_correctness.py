@@ -0,0 +1,289 @@
+# tests/test_correctness.py
+import heapq
+import random
+from collections import deque
+
+import pytest
+
+import core
+from algorithms import (
+    bfs, dfs, dijkstra, greedy, astar, rrt, prm, visibility, rrt_connect, cooperative
+)
+from conftest import MAP_SIZES, bfs_distance, drain, path_cells, random_agents
+
+SHORTEST = {"bfs": bfs.run, "dijkstra": dijkstra.run, "astar": astar.run}
+ANY_PATH = {"dfs": dfs.run, "greedy": greedy.run}
+
+STEPS_4 = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+STEPS_8 = STEPS_4 + [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+
+def connects(start, goal, cells, steps=STEPS_4):
+    """True if start reaches goal moving only through `cells`."""
+    allowed = cells | {goal}
+    seen = {start}
+    q = deque([start])
+    while q:
+        r, c = q.popleft()
+        if (r, c) == goal:
+            return True
+        for dr, dc in steps:
+            nb = (r + dr, c + dc)
+            if nb in allowed and nb not in seen:
+                seen.add(nb)
+                q.append(nb)
+    return False
+
+
+def solve(run, start, goal):
+    core.reset_search_states()
+    state, _ = drain(run(start, goal))
+    return state, path_cells()
+
+
+@pytest.mark.parametrize("size", MAP_SIZES, ids=lambda s: f"{s[0]}x{s[1]}")
+def test_shortest_path_lengths_agree(make_map, size):
+    start, goal = make_map(*size)
+    expected = bfs_distance(start, goal)
+
+    for name, run in SHORTEST.items():
+        state, cells = solve(run, start, goal)
+        assert state == "done", name
+        # painted cells exclude start and goal
+        assert len(cells) == expected - 1, name
+        assert connects(start, goal, cells), name
+
+
+@pytest.mark.parametrize("name", sorted(ANY_PATH))
+@pytest.mark.parametrize("size", MAP_SIZES, ids=lambda s: f"{s[0]}x{s[1]}")
+def test_paths_are_valid(make_map, size, name):
+    start, goal = make_map(*size)
+    state, cells = solve(ANY_PATH[name], start, goal)
+    assert state == "done"
+    assert all(core.grid[r][c] == core.PATH for r, c in cells)
+    assert connects(start, goal, cells)
+    assert len(cells) >= bfs_distance(start, goal) - 1
+
+
+def test_unreachable_goal_fails(make_map):
+    start, goal = make_map(25, 40)
+    for dr, dc in STEPS_4:
+        r, c = goal[0] + dr, goal[1] + dc
+        if 0 <= r < 25 and 0 <= c < 40:
+            core.grid[r][c] = core.WALL
+    for name, run in {**SHORTEST, **ANY_PATH}.items():
+        state, cells = solve(run, start, goal)
+        assert state == "fail", name
+        assert not cells, name
+
+
+@pytest.mark.parametrize(
+    "run", [rrt.run, prm.run, rrt_connect.run], ids=["rrt", "prm", "rrt_connect"]
+)
+def test_sampling_planners_are_reproducible(make_map, run):
+    start, goal = make_map(25, 40)
+
+    results = []
+    for _ in range(2):
+        core.reset_search_states()
+        random.seed(7)
+        state, steps = drain(run(start, goal))
+        results.append((state, steps, [row[:] for row in core.grid]))
+
+    assert results[0] == results[1]
+    state, _, _ = results[0]
+    if state == "done":
+        assert connects(start, goal, path_cells(), STEPS_8)
+
+
+@pytest.mark.parametrize("size", MAP_SIZES, ids=lambda s: f"{s[0]}x{s[1]}")
+def test_visibility_path_is_valid_and_repeatable(make_map, size):
+    start, goal = make_map(*size)
+
+    grids = []
+    for _ in range(2):
+        state, cells = solve(visibility.run, start, goal)
+        assert state == "done"
+        assert connects(start, goal, cells, STEPS_8)
+        # straight segments never paint more cells than the 4-connected path
+        assert len(cells) <= bfs_distance(start, goal) - 1
+        grids.append([row[:] for row in core.grid])
+    assert grids[0] == grids[1]
+
+
+def corner_graph_distance(start, goal):
+    """Brute-force Dijkstra over every corner pair plus start and goal."""
+    corners, _ = visibility.corner_graph()
+    nodes = set(corners) | {start, goal}
+    dist = {start: 0.0}
+    heap = [(0.0, start)]
+    done = set()
+    while heap:
+        d, u = heapq.heappop(heap)
+        if u in done:
+            continue
+        if u == goal:
+            return d
+        done.add(u)
+        for v in nodes - done:
+            if core.line_of_sight(u, v):
+                nd = d + core.euclidean(u, v)
+                if nd < dist.get(v, float("inf")):
+                    dist[v] = nd
+                    heapq.heappush(heap, (nd, v))
+    return None
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_visibility_path_is_shortest_over_corner_pairs(make_map, monkeypatch, seed):
+    start, _ = make_map(14, 22, seed=seed)
+    drawn = []
+    monkeypatch.setattr(visibility, "draw_segment_path", lambda points, s, g: drawn.append(points))
+
+    for a, b in random_agents(start, 10, seed=seed):
+        drawn.clear()
+        state, _ = drain(visibility.run(a, b))
+        assert state == "done", (a, b)
+        (points,) = drawn
+        length = sum(core.euclidean(p, q) for p, q in zip(points, points[1:]))
+        assert length == pytest.approx(corner_graph_distance(a, b)), (a, b)
+
+
+def test_visibility_line_of_sight_matches_core(make_map):
+    make_map(25, 40)
+    blocked = visibility._blocked()
+    cells = [(r, c) for r in range(25) for c in range(40) if not blocked[r * 40 + c]]
+    targets = cells[::7]
+    for p in cells[::5]:
+        visible = set(visibility._visible(p, targets, blocked, 40))
+        for q in targets:
+            assert (q in visible) == core.line_of_sight(p, q), (p, q)
+
+
+def test_visibility_graph_is_cached_per_map_version(make_map):
+    make_map(25, 40)
+    graph = visibility.corner_graph()
+    assert visibility.corner_graph() is graph
+
+    core.walls_changed()
+    assert visibility.corner_graph() is not graph
+
+
+def test_rrt_connect_seed_is_private(make_map):
+    start, goal = make_map(25, 40)
+
+    grids = []
+    for global_seed in (1, 2):
+        core.reset_search_states()
+        random.seed(global_seed)
+        state, _ = drain(rrt_connect.run(start, goal, seed=3))
+        grids.append((state, [row[:] for row in core.grid]))
+    assert grids[0] == grids[1]
+
+
+@pytest.mark.parametrize("size", MAP_SIZES, ids=lambda s: f"{s[0]}x{s[1]}")
+def test_rrt_connect_succeeds_in_few_iterations(make_map, size):
+    start, goal = make_map(*size)
+
+    iterations = []
+    for seed in range(10):
+        core.reset_search_states()
+        stats = {}
+        state, _ = drain(rrt_connect.run(start, goal, seed=seed, stats=stats))
+        assert state == "done", seed
+        assert connects(start, goal, path_cells(), STEPS_8), seed
+        assert stats["time"] > 0
+        iterations.append(stats["iterations"])
+
+    iterations.sort()
+    assert iterations[len(iterations) // 2] < rrt_connect.RRT_CONNECT_MAX_ITERS // 20
+
+
+def assert_conflict_free(agents, paths):
+    assert len(paths) == len(agents)
+    for (start, goal), path in zip(agents, paths):
+        assert path[0] == start and path[-1] == goal
+        assert len(path) == len(paths[0])
+        for (r1, c1), (r2, c2) in zip(path, path[1:]):
+            assert abs(r1 - r2) + abs(c1 - c2) <= 1
+            assert core.grid[r2][c2] != core.WALL
+
+    for t in range(len(paths[0])):
+        cells = [path[t] for path in paths]
+        assert len(set(cells)) == len(cells), f"vertex conflict at t={t}"
+        if t:
+            moves = {(path[t - 1], path[t]) for path in paths if path[t - 1] != path[t]}
+            for a, b in moves:
+                assert (b, a) not in moves, f"swap conflict at t={t}"
+
+
+@pytest.mark.parametrize(
+    "size, count", [((25, 40), 20), ((50, 80), 80), ((100, 160), 300)],
+    ids=["25x40", "50x80", "100x160"],
+)
+def test_cooperative_paths_are_conflict_free(make_map, size, count):
+    start, _ = make_map(*size)
+    agents = random_agents(start, count)
+
+    cache = {}
+    paths = cooperative.plan(agents, cache=cache)
+    assert paths is not None
+    assert_conflict_free(agents, paths)
+
+    # memory stays bounded, and temporary make-way goals never enter the cache
+    assert len(cache) <= cooperative.COOP_MAX_TABLES
+    goals = {r * size[1] + c for _, (r, c) in agents}
+    assert {key[-1] for key in cache} <= goals
+
+
+def test_cooperative_evictions_do_not_change_paths(make_map, monkeypatch):
+    start, _ = make_map(50, 80)
+    agents = random_agents(start, 60)
+    expected = cooperative.plan(agents)
+
+    monkeypatch.setattr(cooperative, "COOP_MAX_TABLES", 4)
+    cache = {}
+    assert cooperative.plan(agents, cache=cache) == expected
+    assert len(cache) <= 4
+
+
+def test_cooperative_cache_is_dropped_after_wall_edit(make_map):
+    start, _ = make_map(25, 40)
+    agents = random_agents(start, 20)
+    cache = {}
+    cooperative.plan(agents, cache=cache)
+
+    endpoints = {cell for pair in agents for cell in pair}
+    r, c = next(
+        (r, c) for r in range(25) for c in range(40)
+        if core.grid[r][c] == core.EMPTY and (r, c) not in endpoints
+    )
+    core.grid[r][c] = core.WALL
+    core.walls_changed()
+
+    paths = cooperative.plan(agents, cache=cache)
+    assert all(key[0] == core.map_version for key in cache)
+    if paths is not None:
+        assert_conflict_free(agents, paths)
+    assert paths == cooperative.plan(agents)
+
+
+def test_cooperative_agents_pass_through_pocket(make_map):
+    make_map(2, 5)
+    # a one-wide corridor with a side pocket near one end; the agents have to
+    # pass each other there instead of swapping cells in the corridor
+    core.grid[:] = [
+        [core.WALL, core.WALL, core.WALL, core.EMPTY, core.WALL],
+        [core.EMPTY] * 5,
+    ]
+    agents = [((1, 0), (1, 4)), ((1, 4), (1, 0))]
+
+    paths = cooperative.plan(agents)
+    assert paths is not None
+    assert_conflict_free(agents, paths)
+    assert any((0, 3) in path for path in paths)
+
+
+def test_cooperative_rejects_shared_goals(make_map):
+    start, goal = make_map(25, 40)
+    assert cooperative.plan([(start, goal), (goal, goal)]) is None
@@ -0,0 +1,308 @@
+# tests/test_performance.py
+"""Throughput and memory budgets on fixed seeded maps.
+
+Throughput is measured relative to a fixed pure-Python calibration workload
+run in the same session, so budgets are "work per 1000 calibration nodes"
+rather than absolute rates and hold across machines. Memory budgets are in
+bytes and KiB. A check fails when a change makes it more than PERF_TOLERANCE
+worse (0.3 = 30 %); skip the suite with `-m "not perf"`.
+"""
+import gc
+import os
+import random
+import time
+import tracemalloc
+from collections import deque
+
+import pytest
+
+import core
+from algorithms import (
+    bfs, dfs, dijkstra, greedy, astar, rrt, prm, visibility, rrt_connect, cooperative
+)
+from conftest import MAP_SIZES, drain, random_agents
+
+pytestmark = pytest.mark.perf
+
+PERF_TOLERANCE = float(os.environ.get("PERF_TOLERANCE", "0.3"))
+REPEATS = 3
+
+PLANNERS = {
+    "bfs": bfs.run,
+    "dfs": dfs.run,
+    "dijkstra": dijkstra.run,
+    "greedy": greedy.run,
+    "astar": astar.run,
+    "rrt": rrt.run,
+    "prm": prm.run,
+    "rrt_connect": rrt_connect.run,
+}
+
+# (rows, cols) -> planner -> (expansions per 1000 calibration nodes,
+#                              allocated bytes/expansion, peak KiB)
+BUDGETS = {
+    (25, 40): {
+        "astar": (310, 129, 78),
+        "bfs": (580, 94, 89),
+        "dfs": (480, 127, 24),
+        "dijkstra": (420, 141, 124),
+        "greedy": (280, 123, 11),
+        "prm": (9.3, 1026, 206),
+        "rrt": (10, 22, 61),
+        "rrt_connect": (2.8, 2128, 3),
+    },
+    (50, 80): {
+        "astar": (300, 221, 307),
+        "bfs": (660, 114, 387),
+        "dfs": (640, 151, 241),
+        "dijkstra": (400, 164, 532),
+        "greedy": (320, 142, 24),
+        "prm": (10, 1533, 270),
+        "rrt": (3.7, 23, 120),
+        "rrt_connect": (5.4, 835, 3),
+    },
+    (100, 160): {
+        "astar": (220, 175, 1497),
+        "bfs": (450, 141, 1868),
+        "dfs": (540, 190, 394),
+        "dijkstra": (260, 190, 2445),
+        "greedy": (360, 146, 62),
+        "prm": (0.35, 122949, 724),
+        "rrt": (4.7, 23, 120),
+        "rrt_connect": (15, 141, 9),
+    },
+}
+
+# (rows, cols) -> (corner graph builds per 1000 calibration nodes,
+#                  queries per 1000 calibration nodes against the built graph,
+#                  peak KiB per query)
+VISIBILITY_BUDGETS = {
+    (25, 40): (0.025, 0.37, 58),
+    (50, 80): (0.0013, 0.16, 184),
+    (100, 160): (0.000078, 0.024, 1095),
+}
+
+# (rows, cols) -> (agents, timesteps per 1000 calibration nodes, peak KiB);
+# the peak includes the per-goal distance tables, 300 agents exceed the
+# COOP_MAX_TABLES cap
+COOPERATIVE_BUDGETS = {
+    (50, 80): (80, 0.45, 2125),
+    (100, 160): (300, 0.078, 21380),
+}
+
+# helper -> calls per 1000 calibration nodes on the 100x160 map
+HELPER_BUDGETS = {
+    "neighbors": 1200,
+    "line_of_sight": 260,
+}
+
+
+def _sizes_ids(size):
+    return f"{size[0]}x{size[1]}"
+
+
+def _calibration_bfs():
+    """Fixed pure-Python workload (BFS over an open 120x120 grid) that does
+    not touch the code under test."""
+    size = 120
+    parent = {(0, 0): None}
+    q = deque([(0, 0)])
+    while q:
+        r, c = q.popleft()
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= nr < size and 0 <= nc < size and (nr, nc) not in parent:
+                parent[(nr, nc)] = (r, c)
+                q.append((nr, nc))
+    return len(parent)
+
+
+def _rate(work):
+    """Units of work per second for one call of `work`, with the cyclic
+    garbage collector off (as timeit does) so heap size left behind by
+    earlier tests does not leak into the timing."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        t0 = time.perf_counter()
+        units = work()
+        elapsed = time.perf_counter() - t0
+    finally:
+        if enabled:
+            gc.enable()
+    return units / elapsed if elapsed else float("inf")
+
+
+def relative_rate(work, setup=None, repeats=REPEATS):
+    """Best rate of `work` per 1000 calibration nodes.
+
+    Each repeat runs the calibration BFS immediately before the measured call,
+    so a machine that is slow or busy at that moment slows both sides of the
+    ratio.
+    """
+    best = 0.0
+    for _ in range(repeats):
+        calibration = _rate(_calibration_bfs)
+        if setup is not None:
+            setup()
+        best = max(best, 1000 * _rate(work) / calibration)
+    return best
+
+
+def _seeded_reset():
+    core.reset_search_states()
+    random.seed(0)
+
+
+def memory_profile(run, start, goal):
+    """(allocated bytes per expansion, peak KiB) for one seeded run.
+
+    Allocated bytes are read while the generator is still suspended on its
+    final state, so they cover everything the planner keeps alive
+    (open/closed sets, parents, roadmap).
+    """
+    core.reset_search_states()
+    random.seed(0)
+    tracemalloc.start()
+    try:
+        gen = run(start, goal)
+        steps = 0
+        for state in gen:
+            if state in ("done", "fail"):
+                break
+            steps += 1
+        current, peak = tracemalloc.get_traced_memory()
+        gen.close()
+    finally:
+        tracemalloc.stop()
+    return current / max(1, steps), peak / 1024
+
+
+@pytest.mark.parametrize("name", sorted(PLANNERS))
+@pytest.mark.parametrize("size", MAP_SIZES, ids=_sizes_ids)
+def test_planner_throughput(make_map, size, name):
+    start, goal = make_map(*size)
+    budget, _, _ = BUDGETS[size][name]
+    run = PLANNERS[name]
+    measured = relative_rate(lambda: drain(run(start, goal))[1], setup=_seeded_reset)
+    assert measured >= budget * (1 - PERF_TOLERANCE), (
+        f"{name} {size}: {measured:.3g} expansions per 1000 calibration nodes,"
+        f" budget {budget}"
+    )
+
+
+@pytest.mark.parametrize("name", sorted(PLANNERS))
+@pytest.mark.parametrize("size", MAP_SIZES, ids=_sizes_ids)
+def test_planner_memory(make_map, size, name):
+    start, goal = make_map(*size)
+    _, bytes_budget, peak_budget = BUDGETS[size][name]
+    allocated, peak = memory_profile(PLANNERS[name], start, goal)
+    assert allocated <= bytes_budget * (1 + PERF_TOLERANCE), (
+        f"{name} {size}: {allocated:.0f} bytes/expansion, budget {bytes_budget}"
+    )
+    assert peak <= peak_budget * (1 + PERF_TOLERANCE), (
+        f"{name} {size}: peak {peak:.0f} KiB, budget {peak_budget}"
+    )
+
+
+@pytest.mark.parametrize("size", MAP_SIZES, ids=_sizes_ids)
+def test_visibility_budget(make_map, size):
+    start, goal = make_map(*size)
+    build_budget, budget, peak_budget = VISIBILITY_BUDGETS[size]
+
+    def build():
+        visibility.corner_graph()
+        return 1
+
+    # clearing the cache forces a rebuild; the largest map takes tens of
+    # seconds to link, so it is built once
+    repeats = 1 if size == MAP_SIZES[-1] else REPEATS
+    built = relative_rate(build, setup=visibility._cache.clear, repeats=repeats)
+
+    def query():
+        drain(visibility.run(start, goal))
+        return 1
+
+    measured = relative_rate(query, setup=core.reset_search_states)
+    _, peak = memory_profile(visibility.run, start, goal)
+    assert built >= build_budget * (1 - PERF_TOLERANCE), (
+        f"visibility {size}: {built:.3g} builds per 1000 calibration nodes,"
+        f" budget {build_budget}"
+    )
+    assert measured >= budget * (1 - PERF_TOLERANCE), (
+        f"visibility {size}: {measured:.3g} queries per 1000 calibration nodes,"
+        f" budget {budget}"
+    )
+    assert peak <= peak_budget * (1 + PERF_TOLERANCE), (
+        f"visibility {size}: peak {peak:.0f} KiB, budget {peak_budget}"
+    )
+
+
+@pytest.mark.parametrize("size", sorted(COOPERATIVE_BUDGETS), ids=_sizes_ids)
+def test_cooperative_budget(make_map, size):
+    start, _ = make_map(*size)
+    count, budget, peak_budget = COOPERATIVE_BUDGETS[size]
+    agents = random_agents(start, count)
+
+    cache = {}
+
+    def timesteps():
+        paths = cooperative.plan(agents, cache=cache)
+        assert paths is not None
+        return len(paths[0]) - 1
+
+    # one run: later runs would reuse the distance tables in `cache`
+    measured = relative_rate(timesteps, repeats=1)
+
+    # the cached distance tables are flat arrays of known size; building them
+    # under tracemalloc would dominate the run, so they are counted directly
+    # and the second run is traced. Past COOP_MAX_TABLES goals that run still
+    # rebuilds evicted tables, which are then counted twice (an upper bound).
+    tables = sum(table.itemsize * len(table) for _, table in cache.values())
+    tracemalloc.start()
+    try:
+        cooperative.plan(agents, cache=cache)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    peak = (tables + peak) / 1024
+
+    assert measured >= budget * (1 - PERF_TOLERANCE), (
+        f"cooperative {size}: {measured:.3g} timesteps per 1000 calibration nodes,"
+        f" budget {budget}"
+    )
+    assert peak <= peak_budget * (1 + PERF_TOLERANCE), (
+        f"cooperative {size}: peak {peak:.0f} KiB, budget {peak_budget}"
+    )
+
+
+def _neighbors_calls(start, goal):
+    cells = [(r, c) for r in range(core.ROWS) for c in range(core.COLS)]
+    for rc in cells:
+        for _ in core.neighbors(rc):
+            pass
+    return len(cells)
+
+
+def _line_of_sight_calls(start, goal):
+    rng = random.Random(0)
+    pairs = [
+        ((rng.randrange(core.ROWS), rng.randrange(core.COLS)),
+         (rng.randrange(core.ROWS), rng.randrange(core.COLS)))
+        for _ in range(2000)
+    ]
+    for a, b in pairs:
+        core.line_of_sight(a, b)
+    return len(pairs)
+
+
+HELPERS = {"neighbors": _neighbors_calls, "line_of_sight": _line_of_sight_calls}
+
+
+@pytest.mark.parametrize("name", sorted(HELPERS))
+def test_helper_throughput(make_map, name):
+    start, goal = make_map(100, 160)
+    measured = relative_rate(lambda: HELPERS[name](start, goal))
+    budget = HELPER_BUDGETS[name]
+    assert measured >= budget * (1 - PERF_TOLERANCE), (
+        f"{name}: {measured:.3g} calls per 1000 calibration nodes, budget {budget}"
+    )